@@ -2,24 +2,27 @@
 import os, boto3, json
 #from shared.teams import post_to_teams, simple_card
 from rds_enhanced.handler import run as run_rds_enhanced
+from shared.config import TRUE_SET
 
-
+# module scope so warm invocations reuse the session (and the clients cached against it)
+_SESSION = boto3.Session(region_name=os.environ.get("AWS_REGION","us-east-1"))
 
 def lambda_handler(event, context):
-    env = {k: os.environ.get(k,"") for k in os.environ.keys()}
-    region  = os.environ.get("AWS_REGION","us-east-1")
-    webhook = os.environ["TEAMS_WEBHOOK"]
-    session = boto3.Session(region_name=region)
+    env = os.environ  # read-only here and downstream; no need to copy it per invoke
+    region  = env.get("AWS_REGION","us-east-1")
+    regions = env.get("AWS_REGIONS", region).split(",")
+    webhook = env["TEAMS_WEBHOOK"]
+    session = _SESSION
 
     results = {}
     # flags: set to "true"/"false" to enable/disable modules
-    enable_rds_enhanced = os.environ.get("ENABLE_RDS_ENHANCED", "true").lower() in ("1","true","yes","y")
+    enable_rds_enhanced = env.get("ENABLE_RDS_ENHANCED", "true").lower() in TRUE_SET
 
 
 
 
     if enable_rds_enhanced:
-        results["rds_enhanced"] = run_rds_enhanced(session, webhook, region, env)
+        results["rds_enhanced"] = run_rds_enhanced(session, webhook, region, env, regions)
 
 
     return {"ok": True, "modules": results}
@@ -1,9 +1,35 @@
 # rds_dashboard/handler.py
-import os, re
+import logging, re, threading, time, weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-import boto3
+from operator import itemgetter
+from botocore.config import Config
 from shared.teams import post_to_teams, simple_card
 from shared.collectors import get_acct_title
+from shared.config import TRUE_SET
+
+log = logging.getLogger(__name__)
+
+# ------------- AWS clients (reused while the caller reuses its session) -------------
+_CFG = Config(retries={"mode": "adaptive", "max_attempts": 10}, max_pool_connections=32, tcp_keepalive=True)
+# clients are always built from the caller's session so every call runs under the same identity;
+# weak keys let the cached clients go away together with that session
+_CLIENTS = weakref.WeakKeyDictionary()  # session -> {(service, region): client}
+_CLIENTS_LOCK = threading.Lock()  # Session.client() itself is not thread-safe
+
+def _client(session, service, region):
+    key = (service, region)
+    c = _CLIENTS.get(session, {}).get(key)
+    if c is None:
+        with _CLIENTS_LOCK:
+            cache = _CLIENTS.setdefault(session, {})
+            c = cache.get(key)
+            if c is None:
+                c = cache[key] = session.client(service, region_name=region, config=_CFG)
+    return c
+
+def _clients(session, region):
+    return _client(session, "rds", region), _client(session, "cloudwatch", region)
 
 # ------------- UI helpers -------------
 def _cell(text, *, bold=False, color=None, width="auto", wrap=False):
@@ -13,66 +39,155 @@ def _cell(text, *, bold=False, color=None, width="auto", wrap=False):
     if color: block["color"] = color
     return {"type": "Column", "width": width, "items": [block]}
 
-def _dot_by(level): return {"OK": "🟢", "WARN": "🟡", "ALERT": "🔴"}.get(level, "")
+_HEADERS = ["DB","Engine","Public","Encryption","Write latency","Read latency","CPU","Free space","Connections","Pending Maint","Autoscaling"]
+_WSTR = [str(w) for w in (6,3,3,3,3,3,3,3,3,3,3)]
+_HEADER_COLUMNSET = {"type":"ColumnSet","columns":[_cell(h,bold=True,width=_WSTR[i]) for i,h in enumerate(_HEADERS)]}
+
+_DOT = {"OK": "🟢", "WARN": "🟡", "ALERT": "🔴"}
 def _fmt_pct(v):    return "N/A" if v is None else f"{float(v):.0f}%"
 def _fmt_ms(v):     return "N/A" if v is None else f"{float(v):.0f} ms"
 
+def _lvl_cell(val, warn, alert, fmt, lower_is_worse=False):
+    if val is None: return f"{_DOT['OK']} {fmt(val)}"
+    if lower_is_worse: lvl = "ALERT" if val <= alert else "WARN" if val <= warn else "OK"
+    else:              lvl = "ALERT" if val >= alert else "WARN" if val >= warn else "OK"
+    return f"{_DOT[lvl]} {fmt(val)}"
+
 def _rds_link(region, dbid):
     return f"https://{region}.console.aws.amazon.com/rds/home?region={region}#database:id={dbid}"
 
 # ------------- CloudWatch helpers -------------
-def _cw_latest(cw, ns, metric, dims, minutes=15, period=300, stat="Average"):
+_TS = itemgetter("Timestamp")
+
+def _cw_latest(cw, ns, metric, dims, start, end, period=300, stat="Average"):
     try:
-        end = datetime.now(timezone.utc); start = end - timedelta(minutes=minutes)
         r = cw.get_metric_statistics(Namespace=ns, MetricName=metric, Dimensions=dims,
                                      StartTime=start, EndTime=end, Period=period, Statistics=[stat])
         dps = r.get("Datapoints", [])
         if not dps: return None
-        return max(dps, key=lambda x: x["Timestamp"]).get(stat)
+        return max(dps, key=_TS).get(stat)
     except Exception:
         return None
 
+_RDS_METRICS = ("WriteLatency", "ReadLatency", "CPUUtilization", "FreeStorageSpace", "DatabaseConnections")
+
+def _cw_batch_latest(cw, dbids, start, end, period=300, stat="Average"):
+    # one GetMetricData round trip per 500 queries instead of one GetMetricStatistics per metric/DB
+    out = {dbid: dict.fromkeys(_RDS_METRICS) for dbid in dbids}
+    ids = {}; queries = []
+    for dbid in dbids:
+        for m in _RDS_METRICS:
+            qid = f"m{len(queries)}"; ids[qid] = (dbid, m)
+            queries.append({"Id": qid, "ReturnData": True,
+                            "MetricStat": {"Metric": {"Namespace": "AWS/RDS", "MetricName": m,
+                                                      "Dimensions": [{"Name": "DBInstanceIdentifier", "Value": dbid}]},
+                                           "Period": period, "Stat": stat}})
+    for i in range(0, len(queries), 500):
+        kw = {"MetricDataQueries": queries[i:i+500], "StartTime": start, "EndTime": end,
+              "ScanBy": "TimestampDescending"}
+        try:
+            while True:
+                r = cw.get_metric_data(**kw)
+                for res in r.get("MetricDataResults", []):
+                    dbid, m = ids[res["Id"]]
+                    # TimestampDescending: first value is the latest; later pages never override it
+                    if out[dbid][m] is None and res.get("Values"):
+                        out[dbid][m] = res["Values"][0]
+                if not r.get("NextToken"): break
+                kw["NextToken"] = r["NextToken"]
+        except Exception:
+            # fall back to per-metric lookups for this chunk
+            for q in queries[i:i+500]:
+                dbid, m = ids[q["Id"]]
+                if out[dbid][m] is None:
+                    dims = q["MetricStat"]["Metric"]["Dimensions"]
+                    out[dbid][m] = _cw_latest(cw, "AWS/RDS", m, dims, start, end, period, stat)
+    return out
+
 def _list_db_instances(rds):
     out = []; p = rds.get_paginator("describe_db_instances")
     for page in p.paginate(): out.extend(page.get("DBInstances", []))
     return out
 
+# scoped per session like _CLIENTS, so another account/role never sees this identity's list
+_INSTANCES_CACHE = weakref.WeakKeyDictionary()  # session -> {region: (expiry_epoch, instances)}
+_INSTANCES_LOCK = threading.Lock()
+
+def _cached_instances(session, rds, region, ttl=120):
+    # instance lists change rarely; reuse them across warm invocations within ttl seconds
+    with _INSTANCES_LOCK:
+        cache = _INSTANCES_CACHE.setdefault(session, {})
+    exp, lst = cache.get(region, (0, None))
+    now = time.time()
+    if ttl > 0 and lst is not None and now < exp: return lst
+    lst = _list_db_instances(rds)
+    if ttl > 0: cache[region] = (now + ttl, lst)
+    return lst
+
+def _name_from_tags(tags):
+    return next((t["Value"] for t in tags or [] if t.get("Key") == "Name"), None)
+
 def _get_name_tag(rds, arn):
     try:
-        tags = rds.list_tags_for_resource(ResourceName=arn).get("TagList", [])
-        return next((t["Value"] for t in tags if t.get("Key") == "Name"), None)
+        return _name_from_tags(rds.list_tags_for_resource(ResourceName=arn).get("TagList", []))
     except Exception:
         return None
 
+def _list_pending_actions(rds):
+    # one paginated account-wide listing instead of one call per ARN
+    out = {}
+    try:
+        p = rds.get_paginator("describe_pending_maintenance_actions")
+        for page in p.paginate():
+            for item in page.get("PendingMaintenanceActions", []):
+                out.setdefault(item.get("ResourceIdentifier"), []).append(item)
+    except Exception:
+        pass
+    return out
+
+def _fetch_name_tags(rds, instances):
+    # DescribeDBInstances already returns TagList; only query per ARN when it is absent
+    out = {db.get("DBInstanceArn"): _name_from_tags(db["TagList"]) for db in instances if "TagList" in db}
+    missing = [db.get("DBInstanceArn") for db in instances if "TagList" not in db]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(16, len(missing))) as pool:
+            out.update(zip(missing, pool.map(lambda a: _get_name_tag(rds, a), missing)))
+    return out
+
 # ------------- Email helpers -------------
+_EMAIL_SPLIT = re.compile(r"[,\s;]+")
+
 def _parse_emails(value: str):
     """
     Split emails by comma/semicolon/space/newline and strip blanks.
     Example: "a@x.com, b@x.com; c@x.com d@x.com"
     """
-    parts = re.split(r"[,\s;]+", value or "")
-    # de-duplicate while preserving order
-    seen = set()
-    out = []
-    for p in parts:
-        e = p.strip()
-        if e and e.lower() not in seen:
-            seen.add(e.lower())
-            out.append(e)
-    return out
+    # de-duplicate case-insensitively, keeping the first spelling and original order
+    out = {}
+    for e in _EMAIL_SPLIT.split(value or ""):
+        if e: out.setdefault(e.lower(), e)
+    return list(out.values())
 
-def _send_email_ses(session, region, subject, html, text, env):
-    if env.get("ENABLE_MAIL_REPORT","false").lower() not in ("1","true","t","yes","y"):
-        return
+def _mail_settings(env):
+    """
+    Resolve the SES report settings once per run.
+    Returns (from, to, cc, bcc), or None when mail is disabled or MAIL_FROM/MAIL_TO is missing.
+    """
+    if env.get("ENABLE_MAIL_REPORT","false").lower() not in TRUE_SET:
+        return None
     frm = env.get("MAIL_FROM","").strip()
     tos = _parse_emails(env.get("MAIL_TO",""))
-    ccs = _parse_emails(env.get("MAIL_CC",""))
-    bccs = _parse_emails(env.get("MAIL_BCC",""))
-
     if not frm or not tos:
+        return None
+    return frm, tos, _parse_emails(env.get("MAIL_CC","")), _parse_emails(env.get("MAIL_BCC",""))
+
+def _send_email_ses(session, region, subject, html, text, mail):
+    # mail: the tuple from _mail_settings(); None means no email
+    if not mail:
         return
+    frm, tos, ccs, bccs = mail
 
-    ses = session.client("ses", region_name=region)
+    ses = _client(session, "ses", region)
     dest = {"ToAddresses": tos}
     if ccs: dest["CcAddresses"] = ccs
     if bccs: dest["BccAddresses"] = bccs
@@ -89,41 +204,32 @@ def _send_email_ses(session, region, subject, html, text, env):
         }
     )
 
-def _build_email_html(title, rows):
-    # rows: (db_cell_email, engine, public_cell, enc_cell, write_cell, read_cell, cpu_cell, free_cell, conns_cell, pending_cell, autoscale_cell, db_cell_teams)
-    head = """<style>
+_EMAIL_HEAD = """<style>
       table{border-collapse:collapse;width:100%;font:13px Arial}
       th,td{border:1px solid #ddd;padding:6px 8px}
       th{background:#f5f5f5;text-align:left}
       .right{text-align:right}
     </style>"""
-    tr=[]
-    for r in rows:
-        tr.append(
-            "<tr>"
-            f"<td>{r[0]}</td><td>{r[1]}</td><td>{r[2]}</td><td>{r[3]}</td>"
-            f"<td class='right'>{r[4]}</td><td class='right'>{r[5]}</td>"
-            f"<td class='right'>{r[6]}</td><td class='right'>{r[7]}</td><td class='right'>{r[8]}</td>"
-            f"<td>{r[9]}</td><td>{r[10]}</td>"
-            "</tr>"
-        )
-    html = (
-        f"<html><head>{head}</head><body>"
-        f"<h3>{title}</h3>"
-        "<table>"
-        "<tr><th>DB</th><th>Engine</th><th>Public</th><th>Encryption</th>"
-        "<th>Write latency</th><th>Read latency</th><th>CPU</th><th>Free space</th>"
-        "<th>Connections</th><th>Pending Maint</th><th>Autoscaling</th></tr>"
-        + "\n".join(tr) + "</table></body></html>"
-    )
-    txt = title + "\n" + "\n".join([", ".join(map(str, r[:11])) for r in rows])
+_EMAIL_HEADER = ("<tr><th>DB</th><th>Engine</th><th>Public</th><th>Encryption</th>"
+                 "<th>Write latency</th><th>Read latency</th><th>CPU</th><th>Free space</th>"
+                 "<th>Connections</th><th>Pending Maint</th><th>Autoscaling</th></tr>")
+# bound once so the per-row call skips the attribute lookup
+_EMAIL_ROW_FMT = ("<tr><td>{0}</td><td>{1}</td><td>{2}</td><td>{3}</td>"
+                  "<td class='right'>{4}</td><td class='right'>{5}</td>"
+                  "<td class='right'>{6}</td><td class='right'>{7}</td><td class='right'>{8}</td>"
+                  "<td>{9}</td><td>{10}</td></tr>").format
+
+def _build_email_html(title, rows):
+    # rows: (db_cell_email, engine, public_cell, enc_cell, write_cell, read_cell, cpu_cell, free_cell, conns_cell, pending_cell, autoscale_cell, db_cell_teams)
+    fmt = _EMAIL_ROW_FMT
+    body = "".join([fmt(*r) for r in rows])
+    html = f"<html><head>{_EMAIL_HEAD}</head><body><h3>{title}</h3><table>{_EMAIL_HEADER}{body}</table></body></html>"
+    txt = title + "\n" + "\n".join(", ".join(map(str, r[:11])) for r in rows)
     return html, txt
 
 # ------------- main entry -------------
-def run(session, webhook, region, env):
-    acct = get_acct_title(session)
-    rds = session.client("rds", region_name=region)
-    cw  = session.client("cloudwatch", region_name=region)
+def _run_region(session, region, env, show_region=False):
+    rds, cw = _clients(session, region)
 
     lookback_min = int(env.get("METRIC_LOOKBACK_MIN","15"))
     period_sec   = int(env.get("METRIC_PERIOD_SEC","300"))
@@ -136,7 +242,11 @@ def run(session, webhook, region, env):
     FREE_WARN=float(env.get("FREE_PCT_WARN","20"))
     FREE_ALERT=float(env.get("FREE_PCT_ALERT","10"))
 
-    instances=_list_db_instances(rds)
+    instances=_cached_instances(session, rds, region, int(env.get("INSTANCE_CACHE_TTL_SEC","120")))
+    end=datetime.now(timezone.utc); start=end-timedelta(minutes=lookback_min)
+    metrics=_cw_batch_latest(cw,[db.get("DBInstanceIdentifier","-") for db in instances],start,end,period_sec,"Average")
+    pm_map=_list_pending_actions(rds)
+    tag_map=_fetch_name_tags(rds, instances)
     rows=[]
     issue_flags=[]  # per-row boolean
 
@@ -148,14 +258,14 @@ def run(session, webhook, region, env):
         alloc_gb=db.get("AllocatedStorage")
         max_alloc_gb=db.get("MaxAllocatedStorage")
         arn=db.get("DBInstanceArn")
-        name_tag=_get_name_tag(rds, arn)
+        name_tag=tag_map.get(arn)
 
-        dims=[{"Name":"DBInstanceIdentifier","Value":dbid}]
-        wlat=_cw_latest(cw,"AWS/RDS","WriteLatency",dims,lookback_min,period_sec,"Average")
-        rlat=_cw_latest(cw,"AWS/RDS","ReadLatency",dims,lookback_min,period_sec,"Average")
-        cpu=_cw_latest(cw,"AWS/RDS","CPUUtilization",dims,lookback_min,period_sec,"Average")
-        free_store_b=_cw_latest(cw,"AWS/RDS","FreeStorageSpace",dims,lookback_min,period_sec,"Average")
-        conns=_cw_latest(cw,"AWS/RDS","DatabaseConnections",dims,lookback_min,period_sec,"Average")
+        m=metrics[dbid]
+        wlat=m["WriteLatency"]
+        rlat=m["ReadLatency"]
+        cpu=m["CPUUtilization"]
+        free_store_b=m["FreeStorageSpace"]
+        conns=m["DatabaseConnections"]
 
         write_ms=None if wlat is None else float(wlat)*1000.0
         read_ms=None if rlat is None else float(rlat)*1000.0
@@ -181,66 +291,102 @@ def run(session, webhook, region, env):
         # ----- formatting cells -----
         pending_has=False
         pending_txt="None"
-        try:
-            resp=rds.describe_pending_maintenance_actions(ResourceIdentifier=arn)
-            acts=resp.get("PendingMaintenanceActions",[])
-            if any(item.get("PendingMaintenanceActionDetails") for item in acts):
-                pending_has=True
-                names=set()
-                for item in acts:
-                    for det in item.get("PendingMaintenanceActionDetails",[]):
-                        nm=det.get("Action") or ""
-                        if nm: names.add(nm)
-                pending_txt=", ".join(sorted(names)) or "Yes"
-        except Exception:
-            pass
+        acts=pm_map.get(arn,[])
+        if any(item.get("PendingMaintenanceActionDetails") for item in acts):
+            pending_has=True
+            names=set()
+            for item in acts:
+                for det in item.get("PendingMaintenanceActionDetails",[]):
+                    nm=det.get("Action") or ""
+                    if nm: names.add(nm)
+            pending_txt=", ".join(sorted(names)) or "Yes"
         pending_lvl = "WARN" if pending_has else "OK"
-        pending_cell = f"{_dot_by(pending_lvl)} {pending_txt}"
+        pending_cell = f"{_DOT[pending_lvl]} {pending_txt}"
 
         autoscale_lvl = "ALERT" if autoscale_disabled else "OK"
-        autoscale_cell = f"{_dot_by(autoscale_lvl)} {'Disabled' if autoscale_disabled else 'Enabled'}"
+        autoscale_cell = f"{_DOT[autoscale_lvl]} {'Disabled' if autoscale_disabled else 'Enabled'}"
 
         db_url=_rds_link(region, dbid)
-        db_cell_email = f"<a href='{db_url}'>{dbid}</a>" + (f"<br/><a href='{db_url}'>{name_tag}</a>" if name_tag else "")
-        db_cell_teams = f"[{dbid}]({db_url})" + (f"\n[{name_tag}]({db_url})" if name_tag else "")
-
-        public_cell = f"{_dot_by('ALERT' if public_alert else 'OK')} {'Yes' if public else 'No'}"
-        enc_cell    = f"{_dot_by('ALERT' if enc_disabled else 'OK')} {'Disabled' if enc_disabled else 'Enabled'}"
-        write_cell  = f"{_dot_by('ALERT' if write_alert else 'WARN' if (write_ms and write_ms>=WRITE_WARN) else 'OK')} {_fmt_ms(write_ms)}"
-        read_cell   = f"{_dot_by('ALERT' if read_alert  else 'WARN' if (read_ms  and read_ms >=READ_WARN) else 'OK')} {_fmt_ms(read_ms)}"
-        cpu_cell    = f"{_dot_by('ALERT' if cpu_alert   else 'WARN' if (cpu_pct and cpu_pct>=CPU_WARN) else 'OK')} {_fmt_pct(cpu_pct)}"
-        free_cell   = f"{_dot_by('ALERT' if free_alert  else 'WARN' if (free_pct and free_pct<=FREE_WARN) else 'OK')} {_fmt_pct(free_pct)}"
+        # region suffix keeps same-named DBs apart, only needed in a combined multi-region table
+        reg_sfx = f" ({region})" if show_region else ""
+        db_cell_email = f"<a href='{db_url}'>{dbid}</a>{reg_sfx}" + (f"<br/><a href='{db_url}'>{name_tag}</a>" if name_tag else "")
+        db_cell_teams = f"[{dbid}]({db_url}){reg_sfx}" + (f"\n[{name_tag}]({db_url})" if name_tag else "")
+
+        public_cell = f"{_DOT['ALERT' if public_alert else 'OK']} {'Yes' if public else 'No'}"
+        enc_cell    = f"{_DOT['ALERT' if enc_disabled else 'OK']} {'Disabled' if enc_disabled else 'Enabled'}"
+        write_cell  = _lvl_cell(write_ms, WRITE_WARN, WRITE_ALERT, _fmt_ms)
+        read_cell   = _lvl_cell(read_ms,  READ_WARN,  READ_ALERT,  _fmt_ms)
+        cpu_cell    = _lvl_cell(cpu_pct,  CPU_WARN,   CPU_ALERT,   _fmt_pct)
+        free_cell   = _lvl_cell(free_pct, FREE_WARN,  FREE_ALERT,  _fmt_pct, lower_is_worse=True)
         conns_cell  = f"{int(conns):d}" if isinstance(conns,(int,float)) else "N/A"
 
         rows.append((db_cell_email, engine, public_cell, enc_cell, write_cell, read_cell,
                      cpu_cell, free_cell, conns_cell, pending_cell, autoscale_cell, db_cell_teams))
 
+    # Keep only failing rows
+    return rows, [r for r, bad in zip(rows, issue_flags) if bad]
+
+def run(session, webhook, region, env, regions=None):
+    # nothing to report to -> skip every AWS call
+    wh = webhook or env.get("TEAMS_WEBHOOK","")
+    mail = _mail_settings(env)
+    if not (wh or mail):
+        return {"ok": True, "sent": False, "skipped": "no-sinks"}
+
+    # regions are independent endpoints; scan them concurrently and report once
+    regions = list(dict.fromkeys(r.strip() for r in regions or [] if r.strip())) or [region]
+    acct = get_acct_title(session)
+    rows=[]; failing_rows=[]; errors={}
+    with ThreadPoolExecutor(max_workers=len(regions)) as pool:
+        futs = {r: pool.submit(_run_region, session, r, env, len(regions) > 1) for r in regions}
+        for reg, f in futs.items():
+            # one broken region (opt-in disabled, AuthFailure, throttling) must not sink the others
+            try:
+                reg_rows, reg_failing = f.result()
+            except Exception as e:
+                log.exception("RDS dashboard: region %s failed", reg)
+                errors[reg] = e
+                continue
+            rows.extend(reg_rows); failing_rows.extend(reg_failing)
+    if len(errors) == len(regions):
+        raise next(iter(errors.values()))
+    failed = {"failed_regions": sorted(errors)} if errors else {}
+
     title=f"{acct} - RDS Dashboard (Issues)"
+    if errors: title += f" [failed regions: {', '.join(sorted(errors))}]"
     if not rows:
-        return {"ok": True, "instances": 0, "sent": False, "reason": "no-instances"}
-
-    # Keep only failing rows
-    failing_rows = [r for r, bad in zip(rows, issue_flags) if bad]
+        return {"ok": True, "instances": 0, "sent": False, "reason": "no-instances", **failed}
     if not failing_rows:
-        return {"ok": True, "instances": len(rows), "sent": False, "reason": "no-issues"}
+        return {"ok": True, "instances": len(rows), "sent": False, "reason": "no-issues", **failed}
 
     # ----- Teams card (only failing rows) -----
-    headers=["DB","Engine","Public","Encryption","Write latency","Read latency","CPU","Free space","Connections","Pending Maint","Autoscaling"]
-    widths =[6,3,3,3,3,3,3,3,3,3,3]
-    body=[{"type":"TextBlock","text":title,"weight":"Bolder","size":"Medium"},
-          {"type":"ColumnSet","columns":[_cell(h,bold=True,width=str(widths[i])) for i,h in enumerate(headers)]}]
+    body=[{"type":"TextBlock","text":title,"weight":"Bolder","size":"Medium"}, _HEADER_COLUMNSET]
     for r in failing_rows:
-        teams_row = [r[11], r[1], r[2], r[3], r[4], r[5], r[6], r[7], r[8], r[9], r[10]]
-        body.append({"type":"ColumnSet","columns":[_cell(teams_row[i], width=str(widths[i])) for i in range(len(headers))]})
+        teams_row = (r[11], r[1], r[2], r[3], r[4], r[5], r[6], r[7], r[8], r[9], r[10])
+        body.append({"type":"ColumnSet","columns":[
+            {"type":"Column","width":w,"items":[{"type":"TextBlock","text":t,"wrap":False,"maxLines":1,"size":"Small","spacing":"Small"}]}
+            for w, t in zip(_WSTR, teams_row)]})
     card={"type":"message","attachments":[{"contentType":"application/vnd.microsoft.card.adaptive",
             "content":{"$schema":"http://adaptivecards.io/schemas/adaptive-card.json",
                        "type":"AdaptiveCard","version":"1.4","body":body}}]}
 
-    if webhook or os.environ.get("TEAMS_WEBHOOK",""):
-        post_to_teams(webhook or os.environ.get("TEAMS_WEBHOOK",""), card)
-
     # ----- Email (only failing rows) -----
     html, txt = _build_email_html(title, failing_rows)
-    _send_email_ses(session, region, title, html, txt, env)
 
-    return {"ok": True, "instances": len(rows), "sent": True, "issues": len(failing_rows)}
+    # Teams and SES are independent outbound calls; overlap them
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futs = {}
+        if mail: futs["SES"] = pool.submit(_send_email_ses, session, region, title, html, txt, mail)
+        if wh: futs["Teams"] = pool.submit(post_to_teams, wh, card)
+        # wait for both so neither failure is lost; log each, then re-raise the first
+        send_errors = []
+        for name, f in futs.items():
+            try:
+                f.result()
+            except Exception as e:
+                log.exception("RDS dashboard: %s send failed", name)
+                send_errors.append(e)
+        if send_errors:
+            raise send_errors[0]
+
+    return {"ok": True, "instances": len(rows), "sent": True, "issues": len(failing_rows), **failed}
@@ -0,0 +1,2 @@
+# values accepted as "true" for boolean env flags (ENABLE_*)
+TRUE_SET = frozenset({"1", "true", "t", "yes", "y"})